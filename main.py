@@ -4,8 +4,11 @@
 
 # Standard library imports
 # import tkinter as tk  # F401: Imported but unused - Removed
+import re
+from bisect import insort
 from collections import defaultdict
-from typing import List, Tuple, Dict, Optional, Union  # For type hinting
+from functools import partial
+from typing import List, Tuple, Dict, NamedTuple, Optional, Union  # For type hinting
 
 # Third-party imports
 import customtkinter as ctk
@@ -37,6 +40,69 @@ FACTORS_FROM_WEEKLY: Dict[str, float] = {
     "Yearly": 52.0
 }
 
+# Combined (input, output) factor pairs, built once at import time so a
+# conversion costs one dict lookup and one multiply instead of two of
+# each.
+FACTOR_PAIR: Dict[Tuple[str, str], float] = {
+    (freq_in, freq_out):
+        FACTORS_TO_WEEKLY[freq_in] * FACTORS_FROM_WEEKLY[freq_out]
+    for freq_in in FACTORS_TO_WEEKLY
+    for freq_out in FACTORS_FROM_WEEKLY
+}
+
+# Shape of a valid money amount: digits with up to two decimal places
+# (cents). Pre-validating input against this keeps typos off the
+# exception path - a failed float() costs far more than a regex reject -
+# and filters out float syntax that makes no sense for currency ("1e3").
+AMOUNT_RE = re.compile(r"\s*(?:\d+(?:\.\d{1,2})?|\.\d{1,2})\s*")
+
+# Canonical frequency instances. Strings coming back from the Tk combo
+# boxes are fresh objects each time; mapping them through this table
+# validates them and makes every stored row share the one module-level
+# instance (cheap pointer-equality dict hits later).
+CANONICAL_FREQUENCY: Dict[str, str] = {freq: freq for freq in FREQUENCIES}
+
+# --- Data Records ---
+
+# Named tuples keep each logged row as compact as a plain tuple while
+# giving the code readable field access (entry.amount vs entry[1]).
+
+
+class IncomeEntry(NamedTuple):
+    """One logged income row."""
+
+    name: str
+    amount: float
+    frequency: str
+
+
+class ExpenseEntry(NamedTuple):
+    """One logged expense row."""
+
+    name: str
+    amount: float
+    frequency: str
+    category: str
+    # Pre-formatted "$amount (freq)" label text, formatted once at
+    # insert so redraws skip the per-row f-string work.
+    display_text: str
+
+
+class CategoryBucket:
+    """Per-category expense state: rows, running total, collapse flag.
+
+    Keeping all three on one object means the display path reads plain
+    attributes instead of probing three parallel dicts per category.
+    """
+
+    __slots__ = ("items", "weekly_total", "collapsed")
+
+    def __init__(self) -> None:
+        self.items: List[ExpenseEntry] = []
+        self.weekly_total: float = 0.0
+        self.collapsed: bool = False
+
+
 # --- Helper Functions ---
 
 
@@ -63,19 +129,17 @@ def calculate_budgeted_amount(
         print(f"Warning: Could not convert amount '{amount}' to float.")
         return 0.0
 
-    # PEP 8: E501 Line too long - Fixed
-    if (freq_in not in FACTORS_TO_WEEKLY or
-            budget_freq_out not in FACTORS_FROM_WEEKLY):
+    # One probe of the precombined pair table; None signals an
+    # unsupported frequency combination.
+    factor = FACTOR_PAIR.get((freq_in, budget_freq_out))
+    if factor is None:
         print(
             f"Warning: Unsupported frequency combination: "
             f"{freq_in} -> {budget_freq_out}"
         )
         return 0.0
 
-    # Perform conversion: Input -> Weekly -> Output
-    amount_weekly = numeric_amount * FACTORS_TO_WEEKLY[freq_in]
-    amount_budgeted = amount_weekly * FACTORS_FROM_WEEKLY[budget_freq_out]
-    return amount_budgeted
+    return numeric_amount * factor
 
 
 # --- Main Application Class ---
@@ -98,18 +162,47 @@ class FinancioApp(ctk.CTk):
         self.geometry("1000x750")  # Set initial size
 
         # --- Data Storage ---
-        # (name, amount, frequency)
-        self.income_data: List[Tuple[str, float, str]] = []
-        # (name, amount, frequency, category)
-        self.expense_data: List[Tuple[str, float, str, str]] = []
+        self.income_data: List[IncomeEntry] = []
+        self.expense_data: List[ExpenseEntry] = []
+        # Running weekly-normalised totals, updated on insert so the
+        # insights page and category headers never rescan the logs.
+        self._expense_weekly_total: float = 0.0
+        self._income_weekly_total: float = 0.0
+        # Canonical per-category buckets (rows, running weekly total,
+        # collapse flag), maintained on insert so the display path never
+        # regroups the flat log.
+        self._categories: Dict[str, CategoryBucket] = \
+            defaultdict(CategoryBucket)
 
         # --- State Variables ---
         self.selected_budget_freq: str = "Weekly"  # Default frequency
         self.expense_categories: List[str] = DEFAULT_EXPENSE_CATEGORIES[:]  # Copy
-        # Key: category_name (str), Value: is_collapsed (bool)
-        self.category_collapse_state: Dict[str, bool] = {}
+        # Combo-box default, computed once here; recompute if
+        # expense_categories is ever mutated.
+        self._default_category: str = (self.expense_categories[0]
+                                       if self.expense_categories else "Other")
         self.current_view: Optional[str] = None  # Track current page
         self.success_label: Optional[ctk.CTkLabel] = None  # For temp messages
+        # Debounce state for budget-frequency changes: only the last
+        # value selected within the delay triggers a rebuild.
+        self._freq_after_id: Optional[str] = None
+        self._pending_freq: Optional[str] = None
+        # Last known main-window geometry (x, y, w, h), refreshed by the
+        # <Configure> binding below so popup centering never needs to
+        # force a layout pass with update_idletasks.
+        self._main_geom: Tuple[int, int, int, int] = (0, 0, 1000, 750)
+        self.bind("<Configure>", self._on_main_configure)
+
+        # Widget recycler for the expense list. One slot per category
+        # position holds the header widgets plus its own pool of row
+        # widgets; redraws reconfigure and re-pack these instead of
+        # destroying and recreating them. Reset whenever the expense
+        # page (and thus the scrollable frame) is rebuilt.
+        self._expense_header_pool: List[Dict] = []
+        self._expense_placeholder: Optional[ctk.CTkLabel] = None
+        # Category name -> pooled slot currently displaying it, so a
+        # collapse toggle can pack/forget just that category's widgets.
+        self._category_slots: Dict[str, Dict] = {}
 
         # --- Appearance Settings ---
         ctk.set_appearance_mode("System")  # Use system theme (Light/Dark)
@@ -127,6 +220,24 @@ class FinancioApp(ctk.CTk):
         self.category_header_hover_color = ("#b0b0b0", "#5a5a5a")
         self.positive_balance_color = "#5cb85c"  # Green
         self.negative_balance_color = "#d9534f"  # Red
+        # Default CTkLabel text colour, cached to avoid walking the
+        # ThemeManager dicts on every insights redraw.
+        self._default_label_text_color = (
+            ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+        )
+
+        # --- Shared Fonts ---
+        # Built once and reused across page rebuilds instead of
+        # constructing a fresh CTkFont for every widget.
+        self.page_title_font = ctk.CTkFont(size=20, weight="bold")
+        self.section_title_font = ctk.CTkFont(size=16, weight="bold")
+        self.field_label_font = ctk.CTkFont(size=13)
+        self.summary_label_font = ctk.CTkFont(size=14)
+        self.summary_value_font = ctk.CTkFont(size=14, weight="bold")
+        self.large_bold_font = ctk.CTkFont(size=18, weight="bold")
+        self.small_bold_font = ctk.CTkFont(size=13, weight="bold")
+        self.bold_font = ctk.CTkFont(weight="bold")
+        self.small_font = ctk.CTkFont(size=12)
 
         # --- Build UI ---
         self._setup_sidebar()
@@ -215,7 +326,7 @@ class FinancioApp(ctk.CTk):
         # Page Title
         ctk.CTkLabel(
             self.content_frame, text="Log Your Income",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self.page_title_font
         ).pack(pady=(20, 15))
 
         # Input Area Frame (for centering)
@@ -236,7 +347,7 @@ class FinancioApp(ctk.CTk):
         self.income_amount_entry.pack(pady=8)
 
         ctk.CTkLabel(
-            input_area, text="Frequency:", font=ctk.CTkFont(size=13)
+            input_area, text="Frequency:", font=self.field_label_font
         ).pack(pady=(10, 2))
         self.income_freq_combo = ctk.CTkComboBox(
             input_area, values=FREQUENCIES, width=INPUT_WIDGET_WIDTH, state="readonly"
@@ -255,7 +366,7 @@ class FinancioApp(ctk.CTk):
         budget_area.pack(pady=(15, 5))
         ctk.CTkLabel(
             budget_area, text="Calculate Budget As:",
-            font=ctk.CTkFont(size=13)
+            font=self.field_label_font
         ).pack(pady=(5, 2))
         # Limit options here if desired (e.g., exclude 'Yearly')
         budget_freq_values = ["Weekly", "Fortnightly", "Monthly"]
@@ -278,7 +389,7 @@ class FinancioApp(ctk.CTk):
         # Income Display Area
         ctk.CTkLabel(
             self.content_frame, text="Logged Income",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.section_title_font
         ).pack(pady=(5, 5))
         self.income_display_frame = ctk.CTkScrollableFrame(
             self.content_frame, label_text="", fg_color="transparent"
@@ -289,13 +400,26 @@ class FinancioApp(ctk.CTk):
         self._update_income_display_list()
 
     def _update_selected_budget_freq_action(self, choice: str) -> None:
-        """Update stored budget frequency and refresh relevant views."""
-        self.selected_budget_freq = choice
+        """Record the chosen budget frequency and debounce the refresh."""
+        self._pending_freq = CANONICAL_FREQUENCY.get(choice, choice)
+        # Coalesce rapid combo changes: cancel any pending refresh so
+        # only the final selection triggers a rebuild.
+        if self._freq_after_id is not None:
+            self.after_cancel(self._freq_after_id)
+        self._freq_after_id = self.after(80, self._apply_pending_freq)
+
+    def _apply_pending_freq(self) -> None:
+        """Apply the last selected budget frequency and refresh views."""
+        self._freq_after_id = None
+        if self._pending_freq is None:
+            return
+        self.selected_budget_freq = self._pending_freq
+        self._pending_freq = None
         # Refresh view if it depends on this frequency
         if self.current_view == "expenses":
             self._update_expense_display_list()
         elif self.current_view == "insights":
-            self.show_insights()  # Recalculates totals
+            self._refresh_insight_values()  # In-place label update
 
     def _add_income_action(self) -> None:
         """Get income details, validate, add to data, and update UI."""
@@ -310,22 +434,36 @@ class FinancioApp(ctk.CTk):
         if not amount_str:
             self.show_error_message("Please enter an income amount.")
             return
-        try:
-            amount = float(amount_str)
-            if amount <= 0:
-                raise ValueError("Amount must be positive")
-        except ValueError:
+        # Validate the shape first so float() only ever runs on input
+        # it cannot reject (no exception path on typos)
+        if not AMOUNT_RE.fullmatch(amount_str):
+            self.show_error_message(
+                "Please enter a valid positive number for the amount."
+            )
+            return
+        amount = float(amount_str)
+        if amount <= 0:
             self.show_error_message(
                 "Please enter a valid positive number for the amount."
             )
             return
-        if freq not in FREQUENCIES:
+        # Validate and swap in the canonical frequency instance
+        freq = CANONICAL_FREQUENCY.get(freq)
+        if freq is None:
             self.show_error_message("Please select a valid frequency.")
             return
 
-        # Add Data and Update UI
-        self.income_data.append((income_name, amount, freq))
-        self._update_income_display_list()
+        # Add Data and Update UI (weekly equivalent folded into the
+        # running total on write)
+        amount_weekly = amount * FACTORS_TO_WEEKLY[freq]
+        self.income_data.append(IncomeEntry(income_name, amount, freq))
+        self._income_weekly_total += amount_weekly
+        # O(1) append: only the first entry needs the full rebuild
+        # (which clears the placeholder label)
+        if len(self.income_data) == 1:
+            self._update_income_display_list()
+        else:
+            self._make_income_row(income_name, amount, freq)
         self.show_success_popup(
             f"Logged income '{income_name}': ${amount:.2f}"
         )
@@ -336,9 +474,30 @@ class FinancioApp(ctk.CTk):
         # Reset frequency dropdown
         self.income_freq_combo.set(FREQUENCIES[0])
 
+    def _make_income_row(self, name: str, amount: float, freq: str) -> None:
+        """Pack a single income row at the bottom of the income list."""
+        item_frame = ctk.CTkFrame(
+            self.income_display_frame,
+            fg_color=self.item_frame_bg_color,
+            corner_radius=6
+        )
+        item_frame.pack(fill="x", pady=4, padx=5)
+
+        # Right side: Amount and Frequency
+        ctk.CTkLabel(
+            item_frame, text=f"${amount:.2f} ({freq})", anchor="e"
+        ).pack(side="right", padx=(10, 15), pady=7)
+
+        # Left side: Income Name (expands to fill space)
+        ctk.CTkLabel(
+            item_frame, text=f"{name}", anchor="w"
+        ).pack(side="left", padx=(15, 10), pady=7, fill="x", expand=True)
+        # TODO: Add delete button here if needed
+
     def _update_income_display_list(self) -> None:
         """Clear and repopulate the income display scrollable frame."""
-        # Clear previous items
+        # Clear previous items (full rebuild: page open / future delete;
+        # single adds go through _make_income_row instead)
         for widget in self.income_display_frame.winfo_children():
             widget.destroy()
 
@@ -350,26 +509,9 @@ class FinancioApp(ctk.CTk):
             return
 
         # Populate with current data
-        # Index 'idx' kept for potential future delete functionality
-        for idx, (name, amount, freq) in enumerate(self.income_data):
-            item_frame = ctk.CTkFrame(
-                self.income_display_frame,
-                fg_color=self.item_frame_bg_color,
-                corner_radius=6
-            )
-            item_frame.pack(fill="x", pady=4, padx=5)
-
-            # Right side: Amount and Frequency
-            label_text = f"${amount:.2f} ({freq})"
-            ctk.CTkLabel(
-                item_frame, text=label_text, anchor="e"
-            ).pack(side="right", padx=(10, 15), pady=7)
-
-            # Left side: Income Name (expands to fill space)
-            ctk.CTkLabel(
-                item_frame, text=f"{name}", anchor="w"
-            ).pack(side="left", padx=(15, 10), pady=7, fill="x", expand=True)
-            # TODO: Add delete button here if needed using 'idx'
+        make_row = self._make_income_row
+        for name, amount, freq in self.income_data:
+            make_row(name, amount, freq)
 
     def show_expenses(self) -> None:
         """Display the Expense entry page."""
@@ -383,7 +525,7 @@ class FinancioApp(ctk.CTk):
         # Page Title
         ctk.CTkLabel(
             self.content_frame, text="Log Your Expenses",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self.page_title_font
         ).pack(pady=(20, 15))
 
         # Input Area Frame
@@ -404,7 +546,7 @@ class FinancioApp(ctk.CTk):
         self.expense_amount_entry.pack(pady=6)
 
         ctk.CTkLabel(
-            input_area, text="Frequency:", font=ctk.CTkFont(size=13)
+            input_area, text="Frequency:", font=self.field_label_font
         ).pack(pady=(8, 2))
         self.expense_freq_combo = ctk.CTkComboBox(
             input_area, values=FREQUENCIES, width=INPUT_WIDGET_WIDTH, state="readonly"
@@ -413,16 +555,14 @@ class FinancioApp(ctk.CTk):
         self.expense_freq_combo.pack(pady=(0, 6))
 
         ctk.CTkLabel(
-            input_area, text="Category:", font=ctk.CTkFont(size=13)
+            input_area, text="Category:", font=self.field_label_font
         ).pack(pady=(8, 2))
         self.expense_category_combo = ctk.CTkComboBox(
             input_area, values=self.expense_categories,
             width=INPUT_WIDGET_WIDTH, state="readonly"
         )
         # Ensure a valid default category is set
-        default_category = (self.expense_categories[0]
-                            if self.expense_categories else "Other")
-        self.expense_category_combo.set(default_category)
+        self.expense_category_combo.set(self._default_category)
         self.expense_category_combo.pack(pady=(0, 10))
 
         self.expense_add_btn = ctk.CTkButton(
@@ -440,7 +580,7 @@ class FinancioApp(ctk.CTk):
         # Expense Display Area
         ctk.CTkLabel(
             self.content_frame, text="Logged Expenses",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.section_title_font
         ).pack(pady=(5, 5))
         self.expense_list_frame = ctk.CTkScrollableFrame(
             self.content_frame, label_text="", fg_color="transparent"
@@ -448,6 +588,10 @@ class FinancioApp(ctk.CTk):
         self.expense_list_frame.pack(
             fill="both", expand=True, pady=(0, 10), padx=30
         )
+        # Fresh scrollable frame: pooled widgets died with the old one
+        self._expense_header_pool = []
+        self._expense_placeholder = None
+        self._category_slots = {}
         self._update_expense_display_list()
 
     def _add_expense_action(self) -> None:
@@ -464,27 +608,44 @@ class FinancioApp(ctk.CTk):
         if not amount_str:
             self.show_error_message("Please enter an expense amount.")
             return
-        try:
-            amount = float(amount_str)
-            if amount <= 0:
-                raise ValueError("Amount must be positive")
-        except ValueError:
+        # Same pre-validation as income: reject malformed input without
+        # paying for a ValueError
+        if not AMOUNT_RE.fullmatch(amount_str):
+            self.show_error_message(
+                "Please enter a valid positive number for the amount."
+            )
+            return
+        amount = float(amount_str)
+        if amount <= 0:
             self.show_error_message(
                 "Please enter a valid positive number for the amount."
             )
             return
-        if freq not in FREQUENCIES:
+        # Validate and swap in the canonical frequency instance
+        freq = CANONICAL_FREQUENCY.get(freq)
+        if freq is None:
             self.show_error_message("Please select a valid frequency.")
             return
         if not category or category not in self.expense_categories:
             self.show_error_message("Please select a valid category.")
             return
 
-        # Add Data and Update UI
-        self.expense_data.append((name, amount, freq, category))
-        # Ensure category exists in collapse state (default: expanded)
-        if category not in self.category_collapse_state:
-            self.category_collapse_state[category] = False
+        # Add Data and Update UI (weekly equivalent folded into the
+        # running totals on write)
+        amount_weekly = amount * FACTORS_TO_WEEKLY[freq]
+        entry = ExpenseEntry(
+            name, amount, freq, category, f"${amount:.2f} ({freq})"
+        )
+        self.expense_data.append(entry)
+        # Bucket rows stay sorted (by name, tuple order) via binary
+        # insert; redraws then display them without re-sorting. New
+        # buckets start expanded via the CategoryBucket defaults.
+        bucket = self._categories[category]
+        insort(bucket.items, entry)
+        # Bump the running totals (keeps the insights page and the
+        # category headers O(1) to compute).
+        self._expense_weekly_total += amount_weekly
+        bucket.weekly_total += amount_weekly
 
         self._update_expense_display_list()
         self.show_success_popup(
@@ -495,118 +656,219 @@ class FinancioApp(ctk.CTk):
         self.expense_name_entry.delete(0, 'end')
         self.expense_amount_entry.delete(0, 'end')
         self.expense_freq_combo.set(FREQUENCIES[0])  # Reset frequency
-        default_category = (self.expense_categories[0]
-                            if self.expense_categories else "Other")
-        self.expense_category_combo.set(default_category)  # Reset category
+        self.expense_category_combo.set(self._default_category)  # Reset
 
     def _toggle_category_collapse(self, category_name: str) -> None:
-        """Toggle the collapse state for a category and redraw the list."""
-        if category_name in self.category_collapse_state:
-            self.category_collapse_state[category_name] = \
-                not self.category_collapse_state[category_name]
-            self._update_expense_display_list()  # Redraw needed
-
-    def _update_expense_display_list(self) -> None:
-        """Clear and repopulate the expense list, grouped by category."""
-        # Clear previous display
-        for widget in self.expense_list_frame.winfo_children():
-            widget.destroy()
+        """Toggle the collapse state for one category without a redraw."""
+        bucket = self._categories.get(category_name)
+        if bucket is None:
+            return
+        is_collapsed = not bucket.collapsed
+        bucket.collapsed = is_collapsed
 
-        if not self.expense_data:
-            ctk.CTkLabel(
-                self.expense_list_frame,
-                text="No expenses logged yet.", text_color="gray"
-            ).pack(pady=20)
+        slot = self._category_slots.get(category_name)
+        if slot is None:
+            self._update_expense_display_list()  # Fallback: full refresh
             return
 
-        # Group expenses by category
-        grouped_expenses: Dict[str, List[Tuple[str, float, str]]] = \
-            defaultdict(list)
-        for name, amount, freq, category in self.expense_data:
-            grouped_expenses[category].append((name, amount, freq))
+        # Flip the arrow and show/hide just this category's items frame
+        arrow = "▲" if is_collapsed else "▼"
+        slot["header_btn"].configure(text=f"{arrow} {category_name}")
+        if is_collapsed:
+            slot["items_frame"].pack_forget()
+        else:
+            # Re-pack directly after this category's header to keep
+            # the display order intact
+            slot["items_frame"].pack(
+                fill="x", padx=0, pady=0, after=slot["header_frame"]
+            )
 
-        # Sort categories alphabetically for consistent display
-        sorted_categories = sorted(grouped_expenses.keys())
+    def _create_expense_category_slot(self) -> Dict:
+        """Create the pooled header widgets for one category position."""
+        header_frame = ctk.CTkFrame(
+            self.expense_list_frame, fg_color="transparent"
+        )
+        # Category Total Label (Right Aligned)
+        total_label = ctk.CTkLabel(
+            header_frame, text="",
+            font=self.small_bold_font, anchor="e"
+        )
+        total_label.pack(side="right", padx=(5, 10), pady=4)
+        # Category Header Button (Left Aligned, Clickable)
+        header_btn = ctk.CTkButton(
+            header_frame,
+            text="",
+            fg_color=self.category_header_fg_color,
+            text_color=self.category_header_text_color,
+            hover_color=self.category_header_hover_color,
+            anchor="w",
+            font=self.bold_font
+        )
+        header_btn.pack(side="left", fill="x", expand=True, padx=5, pady=4)
+        # Items Frame (for indentation and conditional display)
+        items_frame = ctk.CTkFrame(
+            self.expense_list_frame, fg_color="transparent"
+        )
+        return {
+            "header_frame": header_frame,
+            "header_btn": header_btn,
+            "total_label": total_label,
+            "items_frame": items_frame,
+            "rows": [],
+        }
+
+    def _create_expense_row(self, items_frame: ctk.CTkFrame) -> Dict:
+        """Create one pooled expense row inside a category items frame."""
+        row_frame = ctk.CTkFrame(
+            items_frame,
+            fg_color=self.item_frame_bg_color,
+            corner_radius=6
+        )
+        # Right side: Amount and Frequency
+        amount_label = ctk.CTkLabel(
+            row_frame, text="", font=self.field_label_font, anchor="e"
+        )
+        amount_label.pack(side="right", padx=(10, 15), pady=6)
+        # Left side: Expense Name
+        name_label = ctk.CTkLabel(
+            row_frame, text="", font=self.field_label_font, anchor="w"
+        )
+        name_label.pack(side="left", padx=(15, 10), pady=6, fill="x",
+                        expand=True)
+        return {
+            "frame": row_frame,
+            "amount_label": amount_label,
+            "name_label": name_label,
+        }
 
-        # Display each category
-        for category in sorted_categories:
-            is_collapsed = self.category_collapse_state.get(category, False)
+    def _update_expense_display_list(self) -> None:
+        """
+        Refresh the expense list, coalescing Tk layout passes.
+
+        The scrollable frame is unmapped for the duration of the
+        rebuild so Tk does one geometry pass when it is re-packed,
+        instead of relayouting after every child pack call.
+        """
+        # CTkScrollableFrame embeds this frame in a canvas and delegates
+        # pack()/pack_forget() to its outer _parent_frame, so the
+        # unmap/remap has to target that outer frame: geometry queries
+        # on the inner frame report the canvas, not the pack manager.
+        outer = self.expense_list_frame._parent_frame
+        # Only unmap/remap when the outer frame is currently packed
+        pack_info = (outer.pack_info()
+                     if outer.winfo_manager() == "pack" else None)
+        if pack_info is not None:
+            outer.pack_forget()
+        try:
+            self._rebuild_expense_rows()
+        finally:
+            if pack_info is not None:
+                outer.pack(**pack_info)
+
+    def _rebuild_expense_rows(self) -> None:
+        """
+        Repopulate the expense list, grouped by category.
+
+        Widgets are recycled from a pool rather than destroyed and
+        recreated: each redraw reconfigures the pooled labels/buttons
+        and re-packs them in display order (widget construction, not
+        configuration, dominates redraw cost in customtkinter).
+        """
+        pool = self._expense_header_pool
+        self._category_slots.clear()
+
+        # Unpack everything first; visible widgets are re-packed in
+        # display order below (pack order follows call order).
+        for slot in pool:
+            slot["header_frame"].pack_forget()
+            slot["items_frame"].pack_forget()
+            for row in slot["rows"]:
+                row["frame"].pack_forget()
+
+        if not self.expense_data:
+            if self._expense_placeholder is None:
+                self._expense_placeholder = ctk.CTkLabel(
+                    self.expense_list_frame,
+                    text="No expenses logged yet.", text_color="gray"
+                )
+            self._expense_placeholder.pack(pady=20)
+            return
+        if self._expense_placeholder is not None:
+            self._expense_placeholder.pack_forget()
+
+        # Expenses are already bucketed by category on insert; sort the
+        # category names alphabetically for consistent display.
+        sorted_categories = sorted(self._categories.keys())
+
+        # One output factor and one formatted suffix serve the whole
+        # redraw.
+        factor_out = FACTORS_FROM_WEEKLY[self.selected_budget_freq]
+        freq_suffix = f" / {self.selected_budget_freq}"
+
+        # Display each category, reusing pooled widgets by position
+        for position, category in enumerate(sorted_categories):
+            bucket = self._categories[category]
+            is_collapsed = bucket.collapsed
             # Up arrow (collapsed), Down arrow (expanded)
             arrow = "▲" if is_collapsed else "▼"
 
-            # Calculate category total based on *selected budget frequency*
-            category_total = sum(
-                calculate_budgeted_amount(amt, frq, self.selected_budget_freq)
-                for _, amt, frq in grouped_expenses[category]
-            )
+            # Category total: running weekly total times output factor
+            category_total = bucket.weekly_total * factor_out
 
-            # --- Category Header Row ---
-            header_frame = ctk.CTkFrame(
-                self.expense_list_frame, fg_color="transparent"
-            )
-            header_frame.pack(fill="x", pady=(5, 0))
-
-            # Category Total Label (Right Aligned)
-            total_label_font = ctk.CTkFont(size=13, weight="bold")
-            total_label_text = (f"${category_total:.2f} / "
-                                f"{self.selected_budget_freq}")
-            total_label = ctk.CTkLabel(
-                header_frame, text=total_label_text,
-                font=total_label_font, anchor="e"
-            )
-            total_label.pack(side="right", padx=(5, 10), pady=4)
+            if position < len(pool):
+                slot = pool[position]
+            else:
+                slot = self._create_expense_category_slot()
+                pool.append(slot)
 
-            # Category Header Button (Left Aligned, Clickable)
-            header_btn = ctk.CTkButton(
-                header_frame,
-                text=f"{arrow} {category}",
-                # Use lambda to pass the correct category name at runtime
-                command=lambda cat=category: self._toggle_category_collapse(cat),
-                fg_color=self.category_header_fg_color,
-                text_color=self.category_header_text_color,
-                hover_color=self.category_header_hover_color,
-                anchor="w",
-                font=ctk.CTkFont(weight="bold")
-            )
-            header_btn.pack(
-                side="left", fill="x", expand=True, padx=5, pady=4
+            slot["total_label"].configure(
+                text=f"${category_total:.2f}" + freq_suffix
             )
-
-            # --- Items Frame (for indentation and conditional display) ---
-            items_frame = ctk.CTkFrame(
-                self.expense_list_frame, fg_color="transparent"
+            slot["header_btn"].configure(
+                text=f"{arrow} {category}",
+                # partial binds the category cheaper than a closure
+                command=partial(self._toggle_category_collapse, category),
             )
-
-            # Populate items only if the category is expanded
+            slot["header_frame"].pack(fill="x", pady=(5, 0))
+            # Remember which slot shows this category so collapse
+            # toggles can update it surgically
+            self._category_slots[category] = slot
+
+            # The items frame is only packed when expanded, but its
+            # rows are always kept configured so a later toggle just
+            # needs to re-pack the frame.
+            items_frame = slot["items_frame"]
             if not is_collapsed:
                 items_frame.pack(fill="x", padx=0, pady=0)
-                # Sort items within category (optional, by name here)
-                sorted_items = sorted(grouped_expenses[category])
-                for name, amount, freq in sorted_items:
-                    item_frame = ctk.CTkFrame(
-                        items_frame,
-                        fg_color=self.item_frame_bg_color,
-                        corner_radius=6
-                    )
-                    # Indent items slightly relative to header
-                    item_frame.pack(fill="x", pady=3, padx=(20, 5))
-
-                    # Right side: Amount and Frequency
-                    amount_freq_text = f"${amount:.2f} ({freq})"
-                    ctk.CTkLabel(
-                        item_frame, text=amount_freq_text,
-                        font=ctk.CTkFont(size=13), anchor="e"
-                    ).pack(side="right", padx=(10, 15), pady=6)
-
-                    # Left side: Expense Name
-                    ctk.CTkLabel(
-                        item_frame, text=f"{name}",
-                        font=ctk.CTkFont(size=13), anchor="w"
-                    ).pack(side="left", padx=(15, 10), pady=6, fill="x",
-                           expand=True)
-                    # TODO: Add delete button here if needed
-
-            # If collapsed, items_frame is created but not packed, hiding items
+            rows = slot["rows"]
+            # Bucket is kept sorted on insert; display as-is
+            sorted_items = bucket.items
+            for row_idx, entry in enumerate(sorted_items):
+                if row_idx < len(rows):
+                    row = rows[row_idx]
+                else:
+                    row = self._create_expense_row(items_frame)
+                    rows.append(row)
+                # Label text was pre-formatted at insert time
+                row["amount_label"].configure(text=entry.display_text)
+                row["name_label"].configure(text=entry.name)
+                # Indent items slightly relative to header
+                row["frame"].pack(fill="x", pady=3, padx=(20, 5))
+
+            # If collapsed, items_frame stays unpacked, hiding its rows
+
+    def _compute_insight_totals(self) -> Tuple[float, float, float]:
+        """
+        Return (total_income, total_expenses, balance) in O(1).
+
+        Both totals come from the running weekly-normalised totals
+        maintained on insert; only the conversion to the selected
+        budget frequency happens here.
+        """
+        factor_out = FACTORS_FROM_WEEKLY[self.selected_budget_freq]
+        total_income = self._income_weekly_total * factor_out
+        total_expenses = self._expense_weekly_total * factor_out
+        return total_income, total_expenses, total_income - total_expenses
 
     def show_insights(self) -> None:
         """Display the Insights page with calculated summaries."""
@@ -617,21 +879,11 @@ class FinancioApp(ctk.CTk):
         # Page Title
         ctk.CTkLabel(
             self.content_frame, text="Budget Insights",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self.page_title_font
         ).pack(pady=(15, 15))
 
         # --- Calculate Totals based on selected frequency ---
-        total_income = sum(
-            calculate_budgeted_amount(amount, freq, self.selected_budget_freq)
-            for _, amount, freq in self.income_data
-        ) if self.income_data else 0.0
-
-        total_expenses = sum(
-            calculate_budgeted_amount(amount, freq, self.selected_budget_freq)
-            for _, amount, freq, _ in self.expense_data  # Ignore category
-        ) if self.expense_data else 0.0
-
-        balance = total_income - total_expenses
+        total_income, total_expenses, balance = self._compute_insight_totals()
 
         # --- Display Summary Frame (using grid for alignment) ---
         results_frame = ctk.CTkFrame(
@@ -642,36 +894,48 @@ class FinancioApp(ctk.CTk):
         results_frame.grid_columnconfigure(0, weight=0)  # Fixed width
         results_frame.grid_columnconfigure(1, weight=1)  # Expandable
 
-        # Define fonts and padding
-        label_font = ctk.CTkFont(size=14)
-        value_font = ctk.CTkFont(size=14, weight="bold")
+        # Shared fonts and padding
+        label_font = self.summary_label_font
+        value_font = self.summary_value_font
         pady_val = 6  # Vertical padding between rows
 
+        # Value labels are kept on the instance so frequency changes can
+        # reconfigure them in place instead of rebuilding the page.
+
         # Row 0: Budget Frequency
         ctk.CTkLabel(
             results_frame, text="Budget Calculated:", font=label_font
         ).grid(row=0, column=0, pady=pady_val, sticky="w")
-        ctk.CTkLabel(
+        self._lbl_freq_val = ctk.CTkLabel(
             results_frame, text=f"{self.selected_budget_freq}", font=value_font
-        ).grid(row=0, column=1, pady=pady_val, sticky="w", padx=5)
+        )
+        self._lbl_freq_val.grid(
+            row=0, column=1, pady=pady_val, sticky="w", padx=5
+        )
 
         # Row 1: Total Income
         ctk.CTkLabel(
             results_frame, text="Total Income:", font=label_font
         ).grid(row=1, column=0, pady=pady_val, sticky="w")
-        ctk.CTkLabel(
+        self._lbl_income_val = ctk.CTkLabel(
             results_frame, text=f"${total_income:.2f}", font=value_font,
             text_color=self.positive_balance_color  # Green
-        ).grid(row=1, column=1, pady=pady_val, sticky="w", padx=5)
+        )
+        self._lbl_income_val.grid(
+            row=1, column=1, pady=pady_val, sticky="w", padx=5
+        )
 
         # Row 2: Total Expenses
         ctk.CTkLabel(
             results_frame, text="Total Expenses:", font=label_font
         ).grid(row=2, column=0, pady=pady_val, sticky="w")
-        ctk.CTkLabel(
+        self._lbl_expenses_val = ctk.CTkLabel(
             results_frame, text=f"${total_expenses:.2f}", font=value_font,
             text_color=self.negative_balance_color  # Red
-        ).grid(row=2, column=1, pady=pady_val, sticky="w", padx=5)
+        )
+        self._lbl_expenses_val.grid(
+            row=2, column=1, pady=pady_val, sticky="w", padx=5
+        )
 
         # Separator
         separator = ctk.CTkFrame(
@@ -689,37 +953,73 @@ class FinancioApp(ctk.CTk):
 
         balance_color = (self.positive_balance_color if balance >= 0
                          else self.negative_balance_color)
-        balance_font = ctk.CTkFont(size=18, weight="bold")
+        balance_font = self.large_bold_font
 
         ctk.CTkLabel(
             balance_frame, text="Remaining Balance:", font=balance_font
         ).grid(row=0, column=0, pady=10, sticky="w")
-        ctk.CTkLabel(
+        self._lbl_balance_val = ctk.CTkLabel(
             balance_frame, text=f"${balance:.2f}", font=balance_font,
             text_color=balance_color
-        ).grid(row=0, column=1, pady=10, padx=10, sticky="w")
+        )
+        self._lbl_balance_val.grid(
+            row=0, column=1, pady=10, padx=10, sticky="w"
+        )
 
         # --- Display Status Message ---
-        status_message = ""
-        status_color = "gray"  # Default color
+        status_message, status_color = self._insight_status(balance)
+        self._lbl_status = ctk.CTkLabel(
+            self.content_frame, text=status_message,
+            font=self.field_label_font, text_color=status_color
+        )
+        self._lbl_status.pack(pady=15, padx=40)
 
+    def _insight_status(self, balance: float) -> Tuple[str, str]:
+        """Return the status message and colour for a given balance."""
         if not self.income_data and not self.expense_data:
-            status_message = "Enter income and expenses to see insights."
-        elif balance > 0:
-            status_message = "You are within your budget!"
-            status_color = self.positive_balance_color
-        elif balance < 0:
-            status_message = "Your expenses currently exceed your income."
-            status_color = self.negative_balance_color
-        else:  # balance == 0
-            status_message = "Your income perfectly matches your expenses."
-            # Use default text color based on theme
-            status_color = ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+            return "Enter income and expenses to see insights.", "gray"
+        if balance > 0:
+            return (
+                "You are within your budget!",
+                self.positive_balance_color
+            )
+        if balance < 0:
+            return (
+                "Your expenses currently exceed your income.",
+                self.negative_balance_color
+            )
+        # balance == 0: use the default theme text colour
+        return (
+            "Your income perfectly matches your expenses.",
+            self._default_label_text_color
+        )
 
-        ctk.CTkLabel(
-            self.content_frame, text=status_message,
-            font=ctk.CTkFont(size=13), text_color=status_color
-        ).pack(pady=15, padx=40)
+    def _refresh_insight_values(self) -> None:
+        """Reconfigure just the insight value labels after a recompute.
+
+        Avoids tearing down and rebuilding the whole insights page when
+        only the numbers change (e.g. a budget-frequency switch).
+        """
+        total_income, total_expenses, balance = self._compute_insight_totals()
+        status_message, status_color = self._insight_status(balance)
+        self._lbl_freq_val.configure(text=f"{self.selected_budget_freq}")
+        self._lbl_income_val.configure(text=f"${total_income:.2f}")
+        self._lbl_expenses_val.configure(text=f"${total_expenses:.2f}")
+        self._lbl_balance_val.configure(
+            text=f"${balance:.2f}",
+            text_color=(self.positive_balance_color if balance >= 0
+                        else self.negative_balance_color)
+        )
+        self._lbl_status.configure(
+            text=status_message, text_color=status_color
+        )
+
+    def _on_main_configure(self, event) -> None:
+        """Record the main window geometry whenever it moves or resizes."""
+        # <Configure> also fires for child widgets; only track the
+        # toplevel itself.
+        if event.widget is self:
+            self._main_geom = (event.x, event.y, event.width, event.height)
 
     def show_error_message(self, message: str) -> None:
         """Display a modal error pop-up window centered on the main app."""
@@ -730,10 +1030,10 @@ class FinancioApp(ctk.CTk):
         error_popup.grab_set()       # Make modal
         error_popup.attributes("-topmost", True)  # Keep on top
 
-        # Center the popup
-        self.update_idletasks()  # Ensure main window geometry is current
-        main_x, main_y = self.winfo_x(), self.winfo_y()
-        main_w, main_h = self.winfo_width(), self.winfo_height()
+        # Center the popup over the cached main-window geometry; the
+        # <Configure> binding keeps it current without forcing a layout
+        # flush here.
+        main_x, main_y, main_w, main_h = self._main_geom
         popup_w, popup_h = 350, 150
         center_x = main_x + (main_w // 2) - (popup_w // 2)
         center_y = main_y + (main_h // 2) - (popup_h // 2)
@@ -748,13 +1048,13 @@ class FinancioApp(ctk.CTk):
         # Title
         ctk.CTkLabel(
             error_popup, text="Oops!",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.large_bold_font
         ).grid(row=0, column=0, pady=(10, 5))
 
         # Message (with wrapping)
         ctk.CTkLabel(
             error_popup, text=message,
-            font=ctk.CTkFont(size=14),
+            font=self.summary_label_font,
             wraplength=320  # Wrap text if it's too long
         ).grid(row=1, column=0, pady=5, padx=15, sticky="nsew")
 
@@ -777,7 +1077,7 @@ class FinancioApp(ctk.CTk):
         self.success_label = ctk.CTkLabel(
             self,  # Parent is the main window (self)
             text=message,
-            font=ctk.CTkFont(size=12),
+            font=self.small_font,
             fg_color=self.positive_balance_color,  # Green background
             text_color="white",                     # White text
             corner_radius=8,
@@ -1,13 +1,42 @@
+import bisect
+import calendar
+import functools
+import heapq
 import json
 import os
-import uuid
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from datetime import datetime, date, timedelta
-from dateutil.relativedelta import relativedelta # More robust for adding months/years
+from sys import intern
+
+# Optional faster JSON backend; stdlib json remains the fallback.
+# orjson also serializes date objects natively.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 DATA_FILE = "financio_data.json"
 
 # --- Helper Functions ---
 
+def add_months(d, n):
+    """Adds n months to a date, clamping to the target month's end."""
+    m = d.month - 1 + n
+    y = d.year + m // 12
+    m = m % 12 + 1
+    return d.replace(year=y, month=m, day=min(d.day, calendar.monthrange(y, m)[1]))
+
+# Frequency -> next-due-date advance, resolved once at module load so
+# the recurring catch-up loop does one dict dispatch per occurrence
+# instead of a string if/elif chain.
+_ADVANCE = {
+    'daily': lambda d: d + timedelta(days=1),
+    'weekly': lambda d: d + timedelta(weeks=1),
+    'monthly': lambda d: add_months(d, 1),
+    'yearly': lambda d: add_months(d, 12),
+}
+
 def clear_screen():
     """Clears the console screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -30,33 +59,112 @@ def get_date_input(prompt):
         except ValueError:
             print("Invalid date format. Please use YYYY-MM-DD.")
 
+# Pure function of its input, so repeated amounts (rent, subscriptions,
+# account balances reprinted per dashboard) hit the cache instead of the
+# format machinery.
+@functools.lru_cache(maxsize=4096)
 def format_currency(amount):
     """Formats a float as currency."""
     return f"${amount:,.2f}"
 
+
+class _FinancioEncoder(json.JSONEncoder):
+    """JSON encoder that writes date objects as ISO strings in place."""
+    def default(self, o):
+        if isinstance(o, date):
+            return o.isoformat()
+        return super().default(o)
+
 # --- Financio Core Class ---
 
 class FinancioApp:
     def __init__(self, data_file=DATA_FILE):
         self.data_file = data_file
+        # Save batching: mutators mark dirty and save immediately,
+        # unless inside a _batch() block, which flushes once on exit
+        self._dirty = False
+        self._batch_depth = 0
         self.data = self._load_data()
+        # Monotonic ID counter, persisted with the data; cheaper than a
+        # uuid4 per record and still unique within this single-user file
+        self.data.setdefault('_next_id', 0)
+        # Soonest recurring due date; None means unknown (forces one
+        # full scan, after which it is maintained incrementally)
+        self._earliest_due = None
+        # Invariant: transactions stay sorted by date (oldest first).
+        # Established once here, maintained by _add_transaction, so the
+        # views never need to re-sort.
+        self.data['transactions'].sort(key=lambda t: t['date'])
+        # Secondary index: (year, month) -> transactions in that month,
+        # so monthly reports scan one bucket instead of the full log.
+        # Alongside it, a running expense total per month makes the
+        # whole-month budget status an O(1) lookup.
+        self._tx_by_month = {}
+        self._month_expense_total = defaultdict(float)
+        for t in self.data['transactions']:
+            self._index_transaction(t)
+        # Set mirror of the badge list: O(1) membership checks on goal
+        # completion instead of scanning the list. The list remains the
+        # canonical, ordered, persisted form.
+        self._badge_set = set(self.data['badges'])
         self._process_recurring_transactions() # Process on startup
 
+    def _index_transaction(self, t):
+        """Adds one transaction to the (year, month) index and totals."""
+        d = t['date']
+        key = (d.year, d.month)
+        self._tx_by_month.setdefault(key, []).append(t)
+        if t['type'] == 'expense':
+            self._month_expense_total[key] += t['amount']
+
+    def _new_id(self, prefix='t'):
+        """Returns the next unique record ID (e.g. 't1a', 'g3')."""
+        self.data['_next_id'] += 1
+        return f"{prefix}{self.data['_next_id']:x}"
+
+    def _add_transaction(self, t):
+        """Inserts a transaction, keeping the date-sorted invariant."""
+        bisect.insort(self.data['transactions'], t, key=lambda x: x['date'])
+        self._index_transaction(t)
+
+    def _transactions_in_period(self, period_start, period_end):
+        """Returns candidate transactions for a period, using the month
+        index when the period falls within a single month (the common
+        current-month case). Callers still filter by exact date."""
+        key = (period_start.year, period_start.month)
+        if key == (period_end.year, period_end.month):
+            return self._tx_by_month.get(key, ())
+        return self.data['transactions']
+
     def _load_data(self):
         """Loads data from the JSON file."""
         try:
-            with open(self.data_file, 'r') as f:
-                loaded_data = json.load(f)
-                # Convert date strings back to date objects
+            with open(self.data_file, 'rb') as f:
+                if orjson is not None:
+                    loaded_data = orjson.loads(f.read())
+                else:
+                    loaded_data = json.load(f)
+                # Convert date strings back to date objects.
+                # date.fromisoformat parses YYYY-MM-DD directly without
+                # building an intermediate datetime; the isinstance
+                # guards make re-loads of already-converted dicts no-ops.
                 for t in loaded_data.get('transactions', []):
-                    t['date'] = datetime.fromisoformat(t['date']).date()
+                    if isinstance(t['date'], str):
+                        t['date'] = date.fromisoformat(t['date'])
+                    # Interned categories and account names share one
+                    # instance apiece, so the group-by and account dict
+                    # lookups compare by pointer
+                    t['category'] = intern(t['category'])
+                    if t.get('account_name'):
+                        t['account_name'] = intern(t['account_name'])
                 for rt in loaded_data.get('recurring_transactions', []):
-                    rt['next_due_date'] = datetime.fromisoformat(rt['next_due_date']).date()
-                    if rt.get('last_processed_date'):
-                         rt['last_processed_date'] = datetime.fromisoformat(rt['last_processed_date']).date()
+                    if isinstance(rt['next_due_date'], str):
+                        rt['next_due_date'] = date.fromisoformat(rt['next_due_date'])
+                    if isinstance(rt.get('last_processed_date'), str):
+                         rt['last_processed_date'] = date.fromisoformat(rt['last_processed_date'])
                 for g in loaded_data.get('goals', []):
-                     if g.get('deadline'):
-                         g['deadline'] = datetime.fromisoformat(g['deadline']).date()
+                     if isinstance(g.get('deadline'), str):
+                         g['deadline'] = date.fromisoformat(g['deadline'])
                 return loaded_data
         except (FileNotFoundError, json.JSONDecodeError):
             print("Data file not found or invalid. Starting with empty data.")
@@ -82,30 +190,42 @@ class FinancioApp:
     def _save_data(self):
         """Saves the current data state to the JSON file."""
         try:
-            # Create a deep copy to avoid modifying original data during serialization
-            data_to_save = json.loads(json.dumps(self.data, default=str)) # Convert dates etc to strings
-
-            # Explicitly format dates as ISO strings before saving
-            for t in data_to_save.get('transactions', []):
-                if isinstance(t.get('date'), date):
-                    t['date'] = t['date'].isoformat()
-            for rt in data_to_save.get('recurring_transactions', []):
-                 if isinstance(rt.get('next_due_date'), date):
-                    rt['next_due_date'] = rt['next_due_date'].isoformat()
-                 if isinstance(rt.get('last_processed_date'), date):
-                    rt['last_processed_date'] = rt['last_processed_date'].isoformat()
-            for g in data_to_save.get('goals', []):
-                if isinstance(g.get('deadline'), date):
-                    g['deadline'] = g['deadline'].isoformat()
-
-
-            with open(self.data_file, 'w') as f:
-                json.dump(data_to_save, f, indent=4)
+            # Write to a temp file and atomically swap it in, so a
+            # crash mid-write can never corrupt the existing data file.
+            # The encoder converts dates during serialization, so no
+            # deep copy or post-hoc date walks are needed.
+            tmp_file = self.data_file + '.tmp'
+            if orjson is not None:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(self.data,
+                                         option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w') as f:
+                    json.dump(self.data, f, indent=4, cls=_FinancioEncoder)
+            os.replace(tmp_file, self.data_file)
+            self._dirty = False
         except IOError as e:
             print(f"Error saving data: {e}")
         except TypeError as e:
              print(f"Error preparing data for saving (serialization issue): {e}")
 
+    def _mark_dirty(self):
+        """Records a mutation; saves now unless a batch is open."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._save_data()
+
+    @contextmanager
+    def _batch(self):
+        """Defers saves within the block to a single flush on exit."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save_data()
+
 
     # --- Core Feature Methods ---
 
@@ -118,10 +238,10 @@ class FinancioApp:
             return
 
         amount = get_float_input("Amount: ")
-        category = input("Category (e.g., Groceries, Salary, Rent): ")
+        category = intern(input("Category (e.g., Groceries, Salary, Rent): "))
         description = input("Description (optional): ")
         trans_date = get_date_input("Date")
-        account_name = input("Affect Account (leave blank if none, e.g. 'Chase Checking', 'Visa Card'): ")
+        account_name = intern(input("Affect Account (leave blank if none, e.g. 'Chase Checking', 'Visa Card'): "))
 
         if account_name and account_name not in self.data['accounts']:
              print(f"Account '{account_name}' not found. Transaction not linked to account.")
@@ -129,7 +249,7 @@ class FinancioApp:
 
 
         transaction = {
-            "id": str(uuid.uuid4()), # Unique ID
+            "id": self._new_id('t'), # Unique ID
             "type": ttype,
             "amount": amount,
             "category": category,
@@ -138,7 +258,7 @@ class FinancioApp:
             "account_name": account_name
         }
 
-        self.data['transactions'].append(transaction)
+        self._add_transaction(transaction)
 
         # Update account balance if linked
         if account_name:
@@ -150,7 +270,7 @@ class FinancioApp:
                 acc['balance'] -= amount # Balance decreases for expenses/payments
                 print(f"Expense added. Account '{account_name}' balance updated to {format_currency(acc['balance'])}")
 
-        self._save_data()
+        self._mark_dirty()
         print("Transaction logged successfully.")
 
 
@@ -163,21 +283,21 @@ class FinancioApp:
             return
 
         amount = get_float_input("Amount: ")
-        category = input("Category: ")
+        category = intern(input("Category: "))
         description = input("Description (optional): ")
         frequency = input("Frequency (daily/weekly/monthly/yearly): ").lower()
         if frequency not in ['daily', 'weekly', 'monthly', 'yearly']:
             print("Invalid frequency.")
             return
         start_date = get_date_input("First occurrence date")
-        account_name = input("Affect Account (leave blank if none): ")
+        account_name = intern(input("Affect Account (leave blank if none): "))
         if account_name and account_name not in self.data['accounts']:
              print(f"Account '{account_name}' not found. Recurring transaction will not be linked.")
              account_name = None
 
 
         recurring_trans = {
-            "id": str(uuid.uuid4()), # Unique ID for the rule
+            "id": self._new_id('rt'), # Unique ID for the rule
             "type": ttype,
             "amount": amount,
             "category": category,
@@ -188,65 +308,85 @@ class FinancioApp:
             "last_processed_date": None # Track last processing
         }
         self.data['recurring_transactions'].append(recurring_trans)
-        self._save_data()
+        if self._earliest_due is None or start_date < self._earliest_due:
+            self._earliest_due = start_date
+        self._mark_dirty()
         print("Recurring transaction rule added.")
 
     def _process_recurring_transactions(self):
         """Checks and processes recurring transactions that are due."""
         today = date.today()
+        # O(1) short-circuit: skip the whole scan when no rule is due
+        if self._earliest_due is not None and self._earliest_due > today:
+            return
         processed_count = 0
+        # Net balance change per account, applied once after the scan
+        # instead of one dict mutation per generated transaction
+        balance_deltas = defaultdict(float)
         for rt in self.data['recurring_transactions']:
             # Ensure dates are date objects
             if isinstance(rt['next_due_date'], str):
-                 rt['next_due_date'] = datetime.fromisoformat(rt['next_due_date']).date()
-            if rt.get('last_processed_date') and isinstance(rt['last_processed_date'], str):
-                 rt['last_processed_date'] = datetime.fromisoformat(rt['last_processed_date']).date()
-
-
-            # Process if due date is today or in the past AND not processed today already
-            if rt['next_due_date'] <= today and rt.get('last_processed_date') != today:
+                 rt['next_due_date'] = date.fromisoformat(rt['next_due_date'])
+            if isinstance(rt.get('last_processed_date'), str):
+                 rt['last_processed_date'] = date.fromisoformat(rt['last_processed_date'])
+
+
+            # Hoist per-rule lookups out of the catch-up loop
+            account_name = rt.get('account_name')
+            if account_name and account_name not in self.data['accounts']:
+                account_name = None
+            advance = _ADVANCE.get(rt['frequency'])
+            if advance is None:
+                # Unknown frequency: skip rather than loop forever
+                continue
+            generated = 0
+
+            # Generate every missed occurrence up to today, not just one
+            # per startup, so a rule catches up after weeks away
+            while rt['next_due_date'] <= today:
                 print(f"Processing recurring transaction: {rt['category']} ({format_currency(rt['amount'])})")
 
                 # Create the actual transaction
                 transaction = {
-                    "id": str(uuid.uuid4()),
+                    "id": self._new_id('t'),
                     "type": rt['type'],
                     "amount": rt['amount'],
                     "category": rt['category'],
                     "description": f"(Recurring) {rt['description']}",
                     "date": rt['next_due_date'], # Log with the due date
-                    "account_name": rt.get('account_name'),
+                    "account_name": account_name,
                     "recurring_id": rt['id'] # Link back to the rule
                 }
-                self.data['transactions'].append(transaction)
-                processed_count += 1
+                self._add_transaction(transaction)
+                generated += 1
 
-                # Update account balance if linked
-                account_name = rt.get('account_name')
-                if account_name and account_name in self.data['accounts']:
-                    acc = self.data['accounts'][account_name]
+                # Accumulate the balance change if linked
+                if account_name:
                     if rt['type'] == 'income':
-                        acc['balance'] += rt['amount']
+                        balance_deltas[account_name] += rt['amount']
                     elif rt['type'] == 'expense':
-                        acc['balance'] -= rt['amount']
-
+                        balance_deltas[account_name] -= rt['amount']
 
                 # Calculate the next due date
-                current_due = rt['next_due_date']
-                if rt['frequency'] == 'daily':
-                    rt['next_due_date'] = current_due + timedelta(days=1)
-                elif rt['frequency'] == 'weekly':
-                    rt['next_due_date'] = current_due + timedelta(weeks=1)
-                elif rt['frequency'] == 'monthly':
-                     # Use relativedelta for month additions to handle month ends correctly
-                    rt['next_due_date'] = current_due + relativedelta(months=1)
-                elif rt['frequency'] == 'yearly':
-                     rt['next_due_date'] = current_due + relativedelta(years=1)
+                rt['next_due_date'] = advance(rt['next_due_date'])
 
+            if generated:
                 rt['last_processed_date'] = today # Mark as processed today
+                processed_count += generated
+
+        # Apply the accumulated deltas, one write per touched account
+        for name, delta in balance_deltas.items():
+            self.data['accounts'][name]['balance'] += delta
+
+        # All due dates are now in the future; remember the soonest so
+        # the next call can skip the scan entirely
+        rules = self.data['recurring_transactions']
+        self._earliest_due = (
+            min(rt['next_due_date'] for rt in rules) if rules else None
+        )
 
         if processed_count > 0:
-            self._save_data()
+            self._mark_dirty()
             print(f"Processed {processed_count} recurring transactions.")
         # No need to print if none were processed on startup
 
@@ -257,10 +397,8 @@ class FinancioApp:
             print("No transactions logged yet.")
             return
 
-        # Sort by date, most recent first
-        sorted_transactions = sorted(self.data['transactions'], key=lambda t: t['date'], reverse=True)
-
-        for t in sorted_transactions:
+        # List is kept date-sorted; just walk it newest-first
+        for t in reversed(self.data['transactions']):
             amount_str = format_currency(t['amount'])
             indicator = "+" if t['type'] == 'income' else "-"
             account_info = f" (Account: {t['account_name']})" if t.get('account_name') else ""
@@ -272,7 +410,7 @@ class FinancioApp:
         print(f"Current periodic income set to: {format_currency(self.data.get('income', 0.0))}")
         new_income = get_float_input("Enter new periodic income amount (e.g., monthly salary): ")
         self.data['income'] = new_income
-        self._save_data()
+        self._mark_dirty()
         print("Income updated.")
 
     def calculate_budget_status(self, period_start=None, period_end=None):
@@ -288,12 +426,19 @@ class FinancioApp:
              # Default to current month if no period specified
             today = date.today()
             period_start = today.replace(day=1)
-            period_end = (period_start + relativedelta(months=1)) - timedelta(days=1)
+            period_end = add_months(period_start, 1) - timedelta(days=1)
             print(f"(Calculating for {period_start.strftime('%B %Y')})")
 
 
-        total_expenses = sum(t['amount'] for t in self.data['transactions']
-                             if t['type'] == 'expense' and period_start <= t['date'] <= period_end)
+        # Whole calendar months (the default period) read the running
+        # total; anything else filters the candidate transactions
+        key = (period_start.year, period_start.month)
+        if (period_start.day == 1
+                and period_end == add_months(period_start, 1) - timedelta(days=1)):
+            total_expenses = self._month_expense_total.get(key, 0.0)
+        else:
+            total_expenses = sum(t['amount'] for t in self._transactions_in_period(period_start, period_end)
+                                 if t['type'] == 'expense' and period_start <= t['date'] <= period_end)
 
         print(f"Periodic Income Set: {format_currency(user_income)}")
         print(f"Total Expenses ({period_start} to {period_end}): {format_currency(total_expenses)}")
@@ -398,7 +543,7 @@ class FinancioApp:
         if principal is not None:
              self.data['accounts'][name]['principal'] = principal
 
-        self._save_data()
+        self._mark_dirty()
         print(f"Account '{name}' added successfully.")
 
 
@@ -435,10 +580,10 @@ class FinancioApp:
     def set_budget_category(self):
         """Sets or updates the budgeted amount for a category."""
         print("\n--- Set Budget Category ---")
-        category = input("Category Name: ")
+        category = intern(input("Category Name: "))
         amount = get_float_input(f"Budgeted Amount for {category}: ")
         self.data['budget'][category] = amount
-        self._save_data()
+        self._mark_dirty()
         print(f"Budget for '{category}' set to {format_currency(amount)}.")
 
     def compare_budget_vs_actual(self, period_start=None, period_end=None):
@@ -449,14 +594,16 @@ class FinancioApp:
              # Default to current month
              today = date.today()
              period_start = today.replace(day=1)
-             period_end = (period_start + relativedelta(months=1)) - timedelta(days=1)
+             period_end = add_months(period_start, 1) - timedelta(days=1)
              print(f"(Comparing for {period_start.strftime('%B %Y')})")
 
-         # Calculate actual spending per category for the period
-         actual_spending = {}
-         for t in self.data['transactions']:
+         # Calculate actual spending per category for the period.
+         # Counter does one hash per row instead of the get-then-store
+         # double lookup.
+         actual_spending = Counter()
+         for t in self._transactions_in_period(period_start, period_end):
              if t['type'] == 'expense' and period_start <= t['date'] <= period_end:
-                 actual_spending[t['category']] = actual_spending.get(t['category'], 0) + t['amount']
+                 actual_spending[t['category']] += t['amount']
 
          if not self.data['budget'] and not actual_spending:
               print("No budget set and no spending recorded for this period.")
@@ -465,12 +612,14 @@ class FinancioApp:
          print("\n{:<20} | {:<15} | {:<15} | {:<15}".format("Category", "Budgeted", "Spent", "Difference"))
          print("-" * 70)
 
-         all_categories = set(self.data['budget'].keys()) | set(actual_spending.keys())
+         all_categories = self.data['budget'].keys() | actual_spending.keys()
 
-         total_budgeted = 0
-         total_spent = 0
+         # Totals computed once up front rather than accumulated inside
+         # the print loop
+         total_budgeted = sum(self.data['budget'].values())
+         total_spent = sum(actual_spending.values())
 
-         for category in sorted(list(all_categories)):
+         for category in sorted(all_categories):
              budgeted = self.data['budget'].get(category, 0.0)
              spent = actual_spending.get(category, 0.0)
              difference = budgeted - spent
@@ -484,8 +633,6 @@ class FinancioApp:
                  format_currency(spent),
                  diff_str
              ))
-             total_budgeted += budgeted
-             total_spent += spent
 
          print("-" * 70)
          total_diff = total_budgeted - total_spent
@@ -525,6 +672,13 @@ class FinancioApp:
             else:
                 print("Invalid choice.")
 
+    def _format_goal_line(self, goal):
+        """Formats one goal's progress line, shared by goal views."""
+        target = goal['target']
+        current = goal['current']
+        progress = (current / target) * 100 if target > 0 else 100
+        return f"{goal['name']}: {format_currency(current)} / {format_currency(target)} ({progress:.1f}%)"
+
     def view_goals(self):
         """Displays current savings goals and progress."""
         print("\n--- Savings Goals ---")
@@ -533,12 +687,8 @@ class FinancioApp:
             return
 
         for i, goal in enumerate(self.data['goals']):
-            name = goal['name']
-            target = goal['target']
-            current = goal['current']
-            progress = (current / target) * 100 if target > 0 else 100
             deadline_str = f" (Deadline: {goal['deadline']})" if goal.get('deadline') else ""
-            print(f"{i+1}. {name}: {format_currency(current)} / {format_currency(target)} ({progress:.1f}%){deadline_str}")
+            print(f"{i+1}. {self._format_goal_line(goal)}{deadline_str}")
 
     def add_goal(self):
          """Adds a new savings goal."""
@@ -555,7 +705,7 @@ class FinancioApp:
                  print("Invalid date format. Deadline not set.")
 
          goal = {
-             "id": str(uuid.uuid4()),
+             "id": self._new_id('g'),
              "name": name,
              "target": target,
              "current": current,
@@ -563,7 +713,7 @@ class FinancioApp:
          }
          self.data['goals'].append(goal)
          self._check_goal_completion(goal) # Check immediate completion
-         self._save_data()
+         self._mark_dirty()
          print(f"Goal '{name}' added.")
 
     def contribute_to_goal(self):
@@ -576,44 +726,47 @@ class FinancioApp:
         try:
             choice = int(input("Enter the number of the goal to contribute to: ")) - 1
             if 0 <= choice < len(self.data['goals']):
-                goal = self.data['goals'][choice]
-                amount = get_float_input(f"Amount to contribute to '{goal['name']}': ")
-                if amount <= 0:
-                     print("Contribution amount must be positive.")
-                     return
-
-                goal['current'] += amount
-                print(f"Contributed {format_currency(amount)} to '{goal['name']}'. New total: {format_currency(goal['current'])}")
-
-                # Optional: Log a corresponding *expense* transaction to track where the money came from
-                log_expense = input("Log this contribution as an expense transaction? (y/n): ").lower()
-                if log_expense == 'y':
-                    print("Logging expense for goal contribution...")
-                    # You might want more details like which account it came from
-                    expense_trans = {
-                        "id": str(uuid.uuid4()),
-                        "type": "expense",
-                        "amount": amount,
-                        "category": "Savings Goal", # Or specific goal name
-                        "description": f"Contribution to goal: {goal['name']}",
-                        "date": date.today(),
-                        "account_name": input("From which account? (leave blank if none): ") or None
-                    }
-                     # Validate account if entered
-                    if expense_trans["account_name"] and expense_trans["account_name"] not in self.data['accounts']:
-                         print(f"Account '{expense_trans['account_name']}' not found. Not linking.")
-                         expense_trans["account_name"] = None
-
-                    self.data['transactions'].append(expense_trans)
-
-                     # Update account balance if linked
-                    if expense_trans["account_name"]:
-                         acc = self.data['accounts'][expense_trans["account_name"]]
-                         acc['balance'] -= amount
-                         print(f"Account '{expense_trans['account_name']}' balance updated to {format_currency(acc['balance'])}")
-
-                self._check_goal_completion(goal)
-                self._save_data()
+                # Batch the goal update and the optional expense into
+                # one save on exit
+                with self._batch():
+                    goal = self.data['goals'][choice]
+                    amount = get_float_input(f"Amount to contribute to '{goal['name']}': ")
+                    if amount <= 0:
+                         print("Contribution amount must be positive.")
+                         return
+
+                    goal['current'] += amount
+                    print(f"Contributed {format_currency(amount)} to '{goal['name']}'. New total: {format_currency(goal['current'])}")
+
+                    # Optional: Log a corresponding *expense* transaction to track where the money came from
+                    log_expense = input("Log this contribution as an expense transaction? (y/n): ").lower()
+                    if log_expense == 'y':
+                        print("Logging expense for goal contribution...")
+                        # You might want more details like which account it came from
+                        expense_trans = {
+                            "id": self._new_id('t'),
+                            "type": "expense",
+                            "amount": amount,
+                            "category": "Savings Goal", # Or specific goal name
+                            "description": f"Contribution to goal: {goal['name']}",
+                            "date": date.today(),
+                            "account_name": intern(input("From which account? (leave blank if none): ")) or None
+                        }
+                         # Validate account if entered
+                        if expense_trans["account_name"] and expense_trans["account_name"] not in self.data['accounts']:
+                             print(f"Account '{expense_trans['account_name']}' not found. Not linking.")
+                             expense_trans["account_name"] = None
+
+                        self._add_transaction(expense_trans)
+
+                         # Update account balance if linked
+                        if expense_trans["account_name"]:
+                             acc = self.data['accounts'][expense_trans["account_name"]]
+                             acc['balance'] -= amount
+                             print(f"Account '{expense_trans['account_name']}' balance updated to {format_currency(acc['balance'])}")
+
+                    self._check_goal_completion(goal)
+                    self._mark_dirty()
 
             else:
                 print("Invalid goal number.")
@@ -625,12 +778,13 @@ class FinancioApp:
         """Checks if a goal is completed and awards a badge if needed."""
         if goal['current'] >= goal['target']:
             badge_name = f"Goal Achieved: {goal['name']}!"
-            if badge_name not in self.data['badges']:
+            if badge_name not in self._badge_set:
                 print(f"\n******************************")
                 print(f"Congratulations! You reached your goal: {goal['name']}")
                 print(f"Badge Earned: {badge_name}")
                 print(f"******************************")
                 self.data['badges'].append(badge_name)
+                self._badge_set.add(badge_name)
                 # Optionally remove completed goal or mark as completed
                 # goal['completed'] = True # Add a completed flag
                 # self._save_data() # Save immediately after badge award
@@ -663,9 +817,8 @@ class FinancioApp:
         if not self.data['transactions']:
             print("No transactions yet.")
         else:
-            # Sort by date, most recent first
-            sorted_transactions = sorted(self.data['transactions'], key=lambda t: t['date'], reverse=True)
-            for t in sorted_transactions[:5]: # Show last 5
+            # List is kept date-sorted; the five newest are at the end
+            for t in self.data['transactions'][:-6:-1]: # Show last 5
                 amount_str = format_currency(t['amount'])
                 indicator = "+" if t['type'] == 'income' else "-"
                 print(f"{t['date']} | {indicator}{amount_str:<10} | {t['category']}")
@@ -676,19 +829,19 @@ class FinancioApp:
             print("No goals set.")
         else:
              for goal in self.data['goals']:
-                target = goal['target']
-                current = goal['current']
-                progress = (current / target) * 100 if target > 0 else 100
-                print(f"- {goal['name']}: {format_currency(current)} / {format_currency(target)} ({progress:.1f}%)")
+                print(f"- {self._format_goal_line(goal)}")
 
 
         # 5. Upcoming Recurring Transactions (Next 5 due)
         print("\n--- Upcoming Recurring Transactions ---")
-        upcoming = sorted([rt for rt in self.data['recurring_transactions']], key=lambda rt: rt['next_due_date'])
+        # Partial selection of the five soonest rules; no copy, no full
+        # sort
+        upcoming = heapq.nsmallest(5, self.data['recurring_transactions'],
+                                   key=lambda rt: rt['next_due_date'])
         if not upcoming:
             print("No recurring transactions scheduled.")
         else:
-            for rt in upcoming[:5]: # Show next 5
+            for rt in upcoming: # Show next 5
                 print(f"{rt['next_due_date']} | {rt['category']} ({format_currency(rt['amount'])}) - {rt['frequency']}")
 
 
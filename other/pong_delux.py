@@ -37,13 +37,24 @@ left_paddle = pygame.Rect(40, HEIGHT // 2 - PADDLE_H // 2, PADDLE_W, PADDLE_H)
 right_paddle = pygame.Rect(WIDTH - 55, HEIGHT // 2 - PADDLE_H // 2, PADDLE_W, PADDLE_H)
 ball = pygame.Rect(WIDTH // 2, HEIGHT // 2, BALL_SIZE, BALL_SIZE)
 ball_vel = [random.choice([-6, 6]), random.choice([-4, 4])]
+# Sub-pixel ball position; the Rect only holds the rounded ints, so
+# fractional velocity (e.g. under the slow powerup) isn't truncated
+# away each frame.
+ball_fx, ball_fy = float(ball.x), float(ball.y)
 ball_trail = deque(maxlen=TRAIL_LENGTH)
 
 # Game state
 left_score = 0
 right_score = 0
 game_over = False
-powerups = []
+# Active powerups as parallel lists (structure-of-arrays): slot i holds
+# the type and rect of one powerup. Keeps the collision sweep iterating
+# flat lists instead of chasing per-powerup dicts.
+pu_types = []
+pu_rects = []
+# Retired powerup Rects, recycled by spawn_powerup instead of
+# allocating a fresh Rect per spawn
+pu_rect_pool = []
 active_powerups = []
 last_powerup_time = pygame.time.get_ticks()
 
@@ -57,40 +68,113 @@ powerup_timers = {
 
 clock = pygame.time.Clock()
 
+# Cached score surface; re-rendered only when a point is scored
+score_surf = None
+score_x = 0
+score_dirty = True
+
+# Dirty-rect state: rects drawn last frame, erased and re-updated next
+# frame instead of clearing and flipping the whole framebuffer. Seeded
+# with the full screen so the first frame paints everything.
+prev_rects = [WIN.get_rect()]
+
+# Opaque black tiles keyed by size, so dirty-rect erases go through the
+# blit fast path instead of a fill per rect. Built lazily: ball/trail,
+# powerup, each paddle height and the HUD surfaces settle into a
+# handful of sizes after the first frames.
+black_tiles = {}
+
+
+def erase_rect(rect):
+    size = rect.size
+    # Big rects (e.g. the seeded full-screen repaint) aren't worth
+    # keeping a tile for
+    if size[0] > 200 or size[1] > 200:
+        WIN.fill(BLACK, rect)
+        return
+    tile = black_tiles.get(size)
+    if tile is None:
+        tile = pygame.Surface(size)
+        tile.fill(BLACK)
+        black_tiles[size] = tile
+    WIN.blit(tile, rect)
+
 # Power-Up Types
-POWERUP_TYPES = ['grow', 'shrink', 'slow', 'boost']
+POWERUP_TYPES = ('grow', 'shrink', 'slow', 'boost')
+
+# HUD labels for active powerups, rasterized once with their fixed
+# y-offsets instead of re-rendering the text every frame.
+PU_LABELS = {k: FONT.render(k.upper(), True, RED) for k in POWERUP_TYPES}
+PU_LABEL_Y = {k: 60 + 30 * i for i, k in enumerate(POWERUP_TYPES)}
+
+# Trail segment surfaces, one per slot with its alpha baked in, built
+# once instead of allocating and filling a fresh Surface per segment
+# per frame. Segment i is drawn with the alpha for a full-length trail;
+# shorter trails just use the brighter tail of the ramp.
+TRAIL_SURFS = []
+for i in range(TRAIL_LENGTH):
+    surf = pygame.Surface((BALL_SIZE, BALL_SIZE), pygame.SRCALPHA)
+    surf.fill((*NEON, int(255 * (i + 1) / TRAIL_LENGTH)))
+    TRAIL_SURFS.append(surf)
 
 
 def draw_trail():
-    for i, pos in enumerate(ball_trail):
-        alpha = int(255 * (i + 1) / len(ball_trail))
-        trail_surface = pygame.Surface((BALL_SIZE, BALL_SIZE), pygame.SRCALPHA)
-        trail_surface.fill((*NEON, alpha))
-        WIN.blit(trail_surface, pos)
+    # One batched blits() call instead of one blit per segment
+    offset = TRAIL_LENGTH - len(ball_trail)
+    WIN.blits(
+        [(TRAIL_SURFS[offset + i], pos) for i, pos in enumerate(ball_trail)],
+        doreturn=False
+    )
 
 
 def draw_powerups():
-    for pu in powerups:
-        pygame.draw.circle(WIN, RED, pu['rect'].center, POWERUP_SIZE // 2)
+    for rect in pu_rects:
+        pygame.draw.circle(WIN, RED, rect.center, POWERUP_SIZE // 2)
 
 
-def draw_game():
-    WIN.fill(BLACK)
+def draw_game(now):
+    global score_surf, score_x, score_dirty, prev_rects
+
+    # Erase only what moved last frame instead of clearing 1000x600
+    # pixels; everything dynamic is redrawn below, so scoped erases are
+    # safe even when rects overlap.
+    for rect in prev_rects:
+        erase_rect(rect)
+
+    new_rects = []
     draw_trail()
+    new_rects.extend(
+        pygame.Rect(pos[0], pos[1], BALL_SIZE, BALL_SIZE)
+        for pos in ball_trail
+    )
     draw_powerups()
+    # Copies, not references: a collected Rect can be recycled and
+    # repositioned by a spawn before next frame's erase pass reads it
+    new_rects.extend(rect.copy() for rect in pu_rects)
     pygame.draw.rect(WIN, NEON, left_paddle, border_radius=10)
     pygame.draw.rect(WIN, NEON, right_paddle, border_radius=10)
     pygame.draw.ellipse(WIN, WHITE, ball)
-
-    score_text = FONT.render(f"{left_score} : {right_score}", True, WHITE)
-    WIN.blit(score_text, (WIDTH // 2 - score_text.get_width() // 2, 20))
+    # Paddle/ball rects mutate in place, so snapshot copies
+    new_rects.append(left_paddle.copy())
+    new_rects.append(right_paddle.copy())
+    new_rects.append(ball.copy())
+
+    if score_dirty:
+        score_surf = FONT.render(f"{left_score} : {right_score}", True, WHITE)
+        score_x = WIDTH // 2 - score_surf.get_width() // 2
+        score_dirty = False
+    WIN.blit(score_surf, (score_x, 20))
+    new_rects.append(score_surf.get_rect(topleft=(score_x, 20)))
 
     for ptype, end_time in powerup_timers.items():
-        if pygame.time.get_ticks() < end_time:
-            label = FONT.render(ptype.upper(), True, RED)
-            WIN.blit(label, (20, 60 + 30 * list(powerup_timers.keys()).index(ptype)))
+        if now < end_time:
+            label = PU_LABELS[ptype]
+            WIN.blit(label, (20, PU_LABEL_Y[ptype]))
+            new_rects.append(label.get_rect(topleft=(20, PU_LABEL_Y[ptype])))
 
-    pygame.display.update()
+    # Push last frame's erases plus this frame's draws to the display
+    pygame.display.update(prev_rects + new_rects)
+    prev_rects = new_rects
 
 
 def draw_game_over():
@@ -103,40 +187,54 @@ def draw_game_over():
     pygame.display.update()
 
 
-def move_ai():
-    predict_y = ball.centery + ball_vel[1] * ((right_paddle.left - ball.right) // abs(ball_vel[0]) if ball_vel[0] > 0 else 0)
+def move_ai(now):
+    # Only predict when the ball travels toward the AI; the sign guard
+    # also makes the abs() around the divisor redundant
+    if ball_vel[0] > 0:
+        predict_y = ball.centery + ball_vel[1] * ((right_paddle.left - ball.right) // ball_vel[0])
+    else:
+        predict_y = ball.centery
     center_diff = predict_y - right_paddle.centery
     speed = 5
-    if pygame.time.get_ticks() < powerup_timers['shrink']:
+    if now < powerup_timers['shrink']:
         speed = 3
-    if abs(center_diff) > 10:
-        if center_diff > 0 and right_paddle.bottom < HEIGHT:
-            right_paddle.y += speed
-        elif center_diff < 0 and right_paddle.top > 0:
-            right_paddle.y -= speed
+    # Step toward the target and clamp, instead of branching on each
+    # screen bound separately
+    step = (1 if center_diff > 10 else -1 if center_diff < -10 else 0) * speed
+    right_paddle.y = max(
+        0, min(HEIGHT - right_paddle.height, right_paddle.y + step)
+    )
 
 
 def reset_ball():
+    # getrandbits-based sign flips avoid allocating a choice list on
+    # every point
+    global ball_fx, ball_fy
     ball.center = (WIDTH // 2, HEIGHT // 2)
-    ball_vel[0] *= random.choice([-1, 1])
-    ball_vel[1] = random.choice([-5, 5])
+    ball_fx, ball_fy = float(ball.x), float(ball.y)
+    ball_vel[0] *= 1 - (random.getrandbits(1) << 1)
+    ball_vel[1] = 5 * (1 - (random.getrandbits(1) << 1))
     ball_trail.clear()
 
 
 def handle_movement(keys):
-    if keys[pygame.K_w] and left_paddle.top > 0:
-        left_paddle.y -= 7
-    if keys[pygame.K_s] and left_paddle.bottom < HEIGHT:
-        left_paddle.y += 7
-
-
-def update_ball():
-    global left_score, right_score, game_over
-    speed_factor = 2 if pygame.time.get_ticks() < powerup_timers['boost'] else 1
-    slow_factor = 0.5 if pygame.time.get_ticks() < powerup_timers['slow'] else 1
-    
-    ball.x += int(ball_vel[0] * speed_factor * slow_factor)
-    ball.y += int(ball_vel[1] * speed_factor * slow_factor)
+    # Combine both keys into one signed step and clamp to the screen
+    dy = (keys[pygame.K_s] - keys[pygame.K_w]) * 7
+    left_paddle.y = max(
+        0, min(HEIGHT - left_paddle.height, left_paddle.y + dy)
+    )
+
+
+def update_ball(now):
+    global left_score, right_score, game_over, score_dirty, ball_fx, ball_fy
+    speed_factor = 2 if now < powerup_timers['boost'] else 1
+    slow_factor = 0.5 if now < powerup_timers['slow'] else 1
+
+    # Integrate in floats, round once when writing back to the Rect
+    ball_fx += ball_vel[0] * speed_factor * slow_factor
+    ball_fy += ball_vel[1] * speed_factor * slow_factor
+    ball.x = int(ball_fx)
+    ball.y = int(ball_fy)
     ball_trail.append(ball.topleft)
 
     if ball.top <= 0 or ball.bottom >= HEIGHT:
@@ -149,30 +247,45 @@ def update_ball():
 
     if ball.left <= 0:
         right_score += 1
+        score_dirty = True
         reset_ball()
     elif ball.right >= WIDTH:
         left_score += 1
+        score_dirty = True
         reset_ball()
 
     if left_score >= SCORE_LIMIT or right_score >= SCORE_LIMIT:
         game_over = True
 
-    check_powerup_collision()
+    check_powerup_collision(now)
 
 
 def spawn_powerup():
-    ptype = random.choice(POWERUP_TYPES)
-    rect = pygame.Rect(random.randint(100, WIDTH - 100), random.randint(100, HEIGHT - 100), POWERUP_SIZE, POWERUP_SIZE)
-    powerups.append({'type': ptype, 'rect': rect})
-
-
-def check_powerup_collision():
+    ptype = POWERUP_TYPES[random.randrange(4)]
+    if pu_rect_pool:
+        rect = pu_rect_pool.pop()
+    else:
+        rect = pygame.Rect(0, 0, POWERUP_SIZE, POWERUP_SIZE)
+    rect.x = random.randint(100, WIDTH - 100)
+    rect.y = random.randint(100, HEIGHT - 100)
+    pu_types.append(ptype)
+    pu_rects.append(rect)
+
+
+def check_powerup_collision(now):
     global powerup_timers
-    for pu in powerups[:]:
-        if ball.colliderect(pu['rect']):
-            ptype = pu['type']
-            powerup_timers[ptype] = pygame.time.get_ticks() + 5000
-            powerups.remove(pu)
+    # Swap-and-pop: order doesn't matter, so removal is O(1) with no
+    # element shifting
+    i = 0
+    while i < len(pu_rects):
+        if ball.colliderect(pu_rects[i]):
+            ptype = pu_types[i]
+            powerup_timers[ptype] = now + 5000
+            pu_types[i] = pu_types[-1]
+            pu_types.pop()
+            pu_rect_pool.append(pu_rects[i])
+            pu_rects[i] = pu_rects[-1]
+            pu_rects.pop()
             if ptype == 'grow':
                 left_paddle.height = 160
             elif ptype == 'shrink':
@@ -181,43 +294,61 @@ def check_powerup_collision():
                 pass
             elif ptype == 'boost':
                 pass
+        else:
+            i += 1
 
 
-def check_powerup_expiry():
-    if pygame.time.get_ticks() > powerup_timers['grow']:
+def check_powerup_expiry(now):
+    if now > powerup_timers['grow']:
         left_paddle.height = 100
-    if pygame.time.get_ticks() > powerup_timers['shrink']:
+    if now > powerup_timers['shrink']:
         right_paddle.height = 100
 
 
 def main():
-    global left_score, right_score, game_over, last_powerup_time
+    global left_score, right_score, game_over, last_powerup_time, score_dirty
     run = True
+    # The game-over screen is static; render it once per transition
+    game_over_drawn = False
     while run:
         clock.tick(60)
+        # One clock read serves the whole frame
+        now = pygame.time.get_ticks()
         keys = pygame.key.get_pressed()
 
+        # keys doesn't change within an event batch, so test escape
+        # once per frame rather than per event
+        if keys[pygame.K_ESCAPE]:
+            run = False
+
         for event in pygame.event.get():
-            if event.type == pygame.QUIT or keys[pygame.K_ESCAPE]:
+            if event.type == pygame.QUIT:
                 run = False
             if game_over and event.type == pygame.KEYDOWN and event.key == pygame.K_r:
                 left_score = 0
                 right_score = 0
+                score_dirty = True
                 game_over = False
+                game_over_drawn = False
+                # Game-over screen painted the whole frame; force a
+                # full repaint on the first frame back in play
+                prev_rects[:] = [WIN.get_rect()]
                 reset_ball()
-                powerup_timers.update({k: 0 for k in powerup_timers})
+                for k in powerup_timers:
+                    powerup_timers[k] = 0
 
         if not game_over:
             handle_movement(keys)
-            move_ai()
-            update_ball()
-            if pygame.time.get_ticks() - last_powerup_time > POWERUP_INTERVAL:
+            move_ai(now)
+            update_ball(now)
+            if now - last_powerup_time > POWERUP_INTERVAL:
                 spawn_powerup()
-                last_powerup_time = pygame.time.get_ticks()
-            check_powerup_expiry()
-            draw_game()
-        else:
+                last_powerup_time = now
+            check_powerup_expiry(now)
+            draw_game(now)
+        elif not game_over_drawn:
             draw_game_over()
+            game_over_drawn = True
 
     pygame.quit()
     sys.exit()